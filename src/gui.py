@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, font
 import threading
 import time
+import queue
 import random
 from typing import Dict, List, Optional, Tuple
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -26,13 +27,17 @@ class MemoryVisualizerGUI:
         self.visualizer = MemoryVisualizer()
         self.process_generator = ProcessGenerator(4, 64)
         self.allocated_process_ids = set()
+        self.pending_processes = []
+        self.pending_process_ids = set()
         
         self.allocation_method = AllocationMethod.PAGING
         
         self.simulation_running = False
         self.simulation_thread = None
+        self.simulation_stop_event = threading.Event()  # Wakes the simulation thread on stop
         self.simulation_speed = 1.0
         self.auto_generate_processes = False # New flag for auto process generation
+        self.log_queue = queue.SimpleQueue()  # Messages waiting to be written to the event log
         
         
         self.main_frame = ttk.Frame(self.root)
@@ -187,9 +192,6 @@ class MemoryVisualizerGUI:
         self.canvas = FigureCanvasTkAgg(self.visualizer.get_figure(), master=container)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Configure the figure for better layout
-        self.visualizer.fig.tight_layout(pad=4.0)  # Increased padding in figure
     
     def _create_log_panel(self):
         log_frame = ttk.LabelFrame(self.main_frame, text="Event Log")
@@ -212,7 +214,7 @@ class MemoryVisualizerGUI:
         self.stats_text.configure(state="disabled")
     
     def _update_visualization(self):
-        memory_snapshot = self.memory_manager.get_memory_snapshot()
+        memory_snapshot = self.memory_manager.get_memory_array()
         page_table_snapshot = self.memory_manager.get_page_table_snapshot()
         stats = self.memory_manager.get_memory_stats()
         events = self.memory_manager.get_recent_events()
@@ -220,7 +222,6 @@ class MemoryVisualizerGUI:
         method = self.allocation_method_var.get()
         self.visualizer.update_visualization(memory_snapshot, page_table_snapshot, stats, events,
                                              self.memory_size, self.page_size, method)
-        self.canvas.draw_idle()
         self._update_stats(stats)
         self._update_log(events)
         self.root.after(100, self._update_visualization)
@@ -245,35 +246,46 @@ class MemoryVisualizerGUI:
         self.stats_text.configure(state="disabled")
     
     def _update_log(self, events):
-        # This method can be expanded if you want to show recent events in the stats panel.
-        pass
+        """Write all queued log messages to the event log in one batch"""
+        if self.log_queue.empty():
+            return
+        while True:
+            try:
+                timestamp, message, message_type = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.log_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
+            self.log_text.insert(tk.END, f"{message}\n", message_type)
+        self.log_text.see(tk.END)
     
     def _log_message(self, message, message_type="info"):
+        # Timer and simulation threads log too, so only queue the message here;
+        # the Tk thread writes it out on the next visualization update
         timestamp = time.strftime("%H:%M:%S", time.localtime())
-        self.log_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-        self.log_text.insert(tk.END, f"{message}\n", message_type)
-        self.log_text.see(tk.END)
+        self.log_queue.put((timestamp, message, message_type))
     
     def _toggle_simulation(self):
         if self.simulation_running:
             self.simulation_running = False
+            self.simulation_stop_event.set()
             self.start_stop_var.set("Start Simulation")
             self._log_message("Simulation stopped", "info")
         else:
             self.simulation_running = True
+            self.simulation_stop_event.clear()
             self.start_stop_var.set("Stop Simulation")
             self._log_message("Simulation started", "success")
 
             # Allocate pending processes when simulation starts
-            if hasattr(self, 'pending_processes'):
-                for process_id, size, method, lifetime in self.pending_processes:
-                    success = self.memory_manager.allocate_process(process_id, size, method)
-                    if success:
-                        self._log_message(f"Pending process {process_id} started (size {size}, lifetime {lifetime}s)", "success")
-                        self._schedule_auto_removal(process_id, lifetime)
-                    else:
-                        self._log_message(f"Failed to start pending process {process_id}", "error")
-                self.pending_processes.clear()  # Clear pending queue after allocation
+            for process_id, size, method, lifetime in self.pending_processes:
+                success = self.memory_manager.allocate_process(process_id, size, method)
+                if success:
+                    self._log_message(f"Pending process {process_id} started (size {size}, lifetime {lifetime}s)", "success")
+                    self._schedule_auto_removal(process_id, lifetime)
+                else:
+                    self._log_message(f"Failed to start pending process {process_id}", "error")
+            self.pending_processes.clear()  # Clear pending queue after allocation
+            self.pending_process_ids.clear()
 
             if self.auto_generate_processes:
                 self.simulation_thread = threading.Thread(target=self._run_simulation)
@@ -288,7 +300,9 @@ class MemoryVisualizerGUI:
         while self.simulation_running and self.auto_generate_processes:
             # Add random process only if auto-generate is enabled
             self._add_random_process()
-            time.sleep(self.simulation_speed)
+            # Returns early as soon as the simulation is stopped
+            if self.simulation_stop_event.wait(self.simulation_speed):
+                break
     
 
     def _add_process(self):
@@ -301,6 +315,9 @@ class MemoryVisualizerGUI:
             # Check process ID
             if self.process_id_var.get():
                 process_id = int(self.process_id_var.get())
+                if process_id <= 0:
+                    self._log_message("Process ID must be positive", "error")
+                    return
                 # Check if process ID is already in use
                 if process_id in self.allocated_process_ids:
                     self._log_message(f"Process ID {process_id} is already in use", "error")
@@ -325,15 +342,13 @@ class MemoryVisualizerGUI:
                 else:
                     self._log_message(f"Failed to allocate process {process_id}", "error")
             else:
-                if not hasattr(self, 'pending_processes'):
-                    self.pending_processes = []
-                
                 # Check for duplicate process ID in pending queue
-                if any(process[0] == process_id for process in self.pending_processes):
+                if process_id in self.pending_process_ids:
                     self._log_message(f"Process ID {process_id} is already in pending queue", "error")
                     return
                 
                 self.pending_processes.append((process_id, size, method, lifetime))
+                self.pending_process_ids.add(process_id)
                 self._log_message(f"Process {process_id} added to pending queue (size {size}, lifetime {lifetime}s)", "info")
 
         except ValueError:
@@ -346,10 +361,8 @@ class MemoryVisualizerGUI:
             self.process_generator.next_pid += 1
             
             # Check if ID is not in current allocated processes or pending processes
-            if process_id not in self.allocated_process_ids:
-                if not hasattr(self, 'pending_processes') or \
-                   not any(pending_process[0] == process_id for pending_process in self.pending_processes):
-                    return process_id
+            if process_id not in self.allocated_process_ids and process_id not in self.pending_process_ids:
+                return process_id
     
     def _add_random_process(self):
         if not self.simulation_running:
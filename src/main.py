@@ -1,5 +1,6 @@
 # main.py
 
+import gc
 import tkinter as tk
 from gui import MemoryVisualizerGUI
 
@@ -10,6 +11,9 @@ def main():
     """
     root = tk.Tk()
     app = MemoryVisualizerGUI(root)
+    # The widgets and figure built above live for the whole session, so move
+    # them out of the collector's reach before the redraw loop starts
+    gc.freeze()
     root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
 
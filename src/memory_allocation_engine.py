@@ -1,7 +1,16 @@
+from collections import deque
 from enum import Enum, auto
+import threading
 import time
 from typing import Dict, List, Optional, Tuple
 import random
+import numpy as np
+
+# Memory blocks as published by MemoryManager.get_memory_array(); free blocks
+# have FREE_PROCESS_ID as their process_id
+MEMORY_DTYPE = np.dtype([('start', np.int64), ('size', np.int64), ('end', np.int64), ('process_id', np.int64)])
+FREE_PROCESS_ID = -1
+
 # Define the AllocationMethod enum
 class AllocationMethod(Enum):
     PAGING = auto()
@@ -17,8 +26,13 @@ class MemoryManager:
         self.page_table = [{'frame_id': i, 'process_id': None, 'start_address': i * page_size, 
                            'end_address': (i + 1) * page_size - 1} 
                           for i in range(memory_size // page_size)]
+        # Bit i is set while frame i is free, so free frames can be found with int bit ops
+        self._free_frames = (1 << len(self.page_table)) - 1
         self.allocated_processes = {}
-        self.recent_events = []
+        self.recent_events = deque(maxlen=10)
+        # The GUI, the simulation thread and the auto-removal timers all share one manager;
+        # reentrant so the getters can build on each other
+        self._lock = threading.RLock()
         self.stats = {
             'total_memory': memory_size,
             'used_memory': 0,
@@ -31,34 +45,54 @@ class MemoryManager:
         }
     
     def get_memory_snapshot(self):
-        return self.memory.copy()
+        with self._lock:
+            return self.memory.copy()
+    
+    def get_memory_array(self):
+        """Return the memory blocks as a structured array of MEMORY_DTYPE, in address order"""
+        with self._lock:
+            blocks = self.get_memory_snapshot()
+            return np.fromiter(((block['start'], block['size'], block['end'],
+                                 FREE_PROCESS_ID if block['process_id'] is None else block['process_id'])
+                                for block in blocks), dtype=MEMORY_DTYPE, count=len(blocks))
     
     def get_page_table_snapshot(self):
-        return self.page_table.copy()
+        with self._lock:
+            return self.page_table.copy()
     
     def get_memory_stats(self):
-        return self.stats.copy()
+        with self._lock:
+            return self.stats.copy()
     
     def get_recent_events(self):
-        return self.recent_events[-5:] if self.recent_events else []
+        with self._lock:
+            return list(self.recent_events)[-5:]
     
     def allocate_process(self, process_id, size, method):
-        if method == AllocationMethod.PAGING:
-            return self._allocate_process_paging(process_id, size)
-        else:
-            return self._allocate_process_segmentation(process_id, size)
+        with self._lock:
+            if method == AllocationMethod.PAGING:
+                return self._allocate_process_paging(process_id, size)
+            else:
+                return self._allocate_process_segmentation(process_id, size)
     
     def _allocate_process_paging(self, process_id, size):
         pages_needed = (size + self.page_size - 1) // self.page_size
-        free_frames = [frame for frame in self.page_table if frame['process_id'] is None]
+        free_count = bin(self._free_frames).count('1')
         
-        if len(free_frames) < pages_needed:
-            self._log_event(process_id, "Allocation Failed", f"Not enough free frames. Needed {pages_needed}, available {len(free_frames)}")
+        if free_count < pages_needed:
+            self._log_event(process_id, "Allocation Failed", f"Not enough free frames. Needed {pages_needed}, available {free_count}")
             return False
         
-        allocated_frames = free_frames[:pages_needed]
-        for frame in allocated_frames:
+        # Take the lowest free frames, one bit at a time
+        allocated_frames = []
+        free_frames = self._free_frames
+        while len(allocated_frames) < pages_needed:
+            lowest = free_frames & -free_frames
+            free_frames ^= lowest
+            frame = self.page_table[lowest.bit_length() - 1]
             frame['process_id'] = process_id
+            allocated_frames.append(frame)
+        self._free_frames = free_frames
         
         self._update_memory_from_page_table()
         self.allocated_processes[process_id] = {
@@ -99,9 +133,7 @@ class MemoryManager:
                 # Update the page table entries covered by this segment
                 start_page = block['start'] // self.page_size
                 end_page = block['end'] // self.page_size
-                for frame in self.page_table:
-                    if start_page <= frame['frame_id'] <= end_page:
-                        frame['process_id'] = process_id
+                self._set_frame_range(start_page, end_page, process_id)
                 
                 # Store the allocation information
                 self.allocated_processes[process_id] = {
@@ -120,6 +152,10 @@ class MemoryManager:
         return False
     
     def deallocate_process(self, process_id):
+        with self._lock:
+            return self._deallocate_process(process_id)
+    
+    def _deallocate_process(self, process_id):
         if process_id not in self.allocated_processes:
             return False
         
@@ -128,25 +164,21 @@ class MemoryManager:
         if process_info['method'] == 'paging':
             # Deallocate pages for paging
             for frame_id in process_info['frames']:
-                for frame in self.page_table:
-                    if frame['frame_id'] == frame_id:
-                        frame['process_id'] = None
+                self.page_table[frame_id]['process_id'] = None
+                self._free_frames |= 1 << frame_id
             self._update_memory_from_page_table()
         else:
             # Deallocate segment for segmentation
-            for block in self.memory:
-                if block['process_id'] == process_id:
-                    block['process_id'] = None
-                    # Also update the page table to reflect the change
-                    start_page = block['start'] // self.page_size
-                    end_page = block['end'] // self.page_size
-                    for frame in self.page_table:
-                        if start_page <= frame['frame_id'] <= end_page:
-                            frame['process_id'] = None
-                    break
-            
-            # Merge adjacent free blocks
-            self._merge_free_blocks()
+            index = self._find_block_index(process_info['start'])
+            block = self.memory[index]
+            block['process_id'] = None
+            # Also update the page table to reflect the change
+            start_page = block['start'] // self.page_size
+            end_page = block['end'] // self.page_size
+            self._set_frame_range(start_page, end_page, None)
+
+            # Merge with adjacent free blocks
+            self._merge_with_neighbors(index)
         
         # Remove process from the allocated list
         del self.allocated_processes[process_id]
@@ -154,6 +186,20 @@ class MemoryManager:
         self._log_event(process_id, "Deallocation", "Process removed from memory")
         return True
     
+    def _set_frame_range(self, start_page, end_page, process_id):
+        """
+        Assign the frames from start_page to end_page to a process, or free them with None.
+        Frame ids match their position in the page table, so the range is a plain slice.
+        """
+        frames = self.page_table[start_page:end_page + 1]
+        for frame in frames:
+            frame['process_id'] = process_id
+        mask = ((1 << len(frames)) - 1) << start_page
+        if process_id is None:
+            self._free_frames |= mask
+        else:
+            self._free_frames &= ~mask
+
     def _update_memory_from_page_table(self):
         """
         Update memory representation from page table.
@@ -167,8 +213,8 @@ class MemoryManager:
         self.memory = []
         current_block = None
         
-        # Process frames in order
-        for frame in sorted(self.page_table, key=lambda x: x['frame_id']):
+        # Process frames in order (the page table is always kept in frame order)
+        for frame in self.page_table:
             start_addr = frame['start_address']
             end_addr = frame['end_address']
             process_id = frame['process_id']
@@ -192,32 +238,51 @@ class MemoryManager:
         if current_block is not None:
             self.memory.append(current_block)
     
-    def _merge_free_blocks(self):
+    def _find_block_index(self, start):
         """
-        Merge adjacent free memory blocks.
-        Used after deallocation to prevent fragmentation.
+        Find the index of the memory block starting at the given address.
+        Memory blocks are kept in address order, so a binary search is enough.
         """
-        i = 0
-        while i < len(self.memory) - 1:
-            if self.memory[i]['process_id'] is None and self.memory[i+1]['process_id'] is None:
-                # Merge with next block
-                self.memory[i]['end'] = self.memory[i+1]['end']
-                self.memory[i]['size'] += self.memory[i+1]['size']
-                self.memory.pop(i+1)
+        low, high = 0, len(self.memory) - 1
+        while low < high:
+            mid = (low + high) // 2
+            if self.memory[mid]['start'] < start:
+                low = mid + 1
             else:
-                i += 1
+                high = mid
+        return low
+
+    def _merge_with_neighbors(self, index):
+        """
+        Merge a newly freed block with its free neighbors.
+        Only the blocks directly before and after it can be free and adjacent.
+        """
+        # Merge with next block
+        if index + 1 < len(self.memory) and self.memory[index + 1]['process_id'] is None:
+            self.memory[index]['end'] = self.memory[index + 1]['end']
+            self.memory[index]['size'] += self.memory[index + 1]['size']
+            self.memory.pop(index + 1)
+        # Merge into previous block
+        if index > 0 and self.memory[index - 1]['process_id'] is None:
+            self.memory[index - 1]['end'] = self.memory[index]['end']
+            self.memory[index - 1]['size'] += self.memory[index]['size']
+            self.memory.pop(index)
     
     def _update_stats(self):
         """
         Update memory usage statistics.
         """
-        # Calculate used and free memory
-        used_memory = sum(block['size'] for block in self.memory if block['process_id'] is not None)
+        # Calculate used memory and the largest free block in a single pass
+        used_memory = 0
+        largest_free_block = 0
+        for block in self.memory:
+            if block['process_id'] is not None:
+                used_memory += block['size']
+            elif block['size'] > largest_free_block:
+                largest_free_block = block['size']
         free_memory = self.memory_size - used_memory
-        
+
         # Calculate external fragmentation
-        free_blocks = [block for block in self.memory if block['process_id'] is None]
-        largest_free_block = max([block['size'] for block in free_blocks], default=0)
         external_fragmentation = 0
         if free_memory > 0:
             external_fragmentation = 1 - (largest_free_block / free_memory)
@@ -252,8 +317,6 @@ class MemoryManager:
             'details': details
         }
         self.recent_events.append(event)
-        if len(self.recent_events) > 10:
-            self.recent_events.pop(0)
     
 
 # Process Generator
@@ -1,20 +1,65 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import matplotlib.colors as mcolors
+from matplotlib.collections import PolyCollection
+from matplotlib.transforms import Bbox
 import numpy as np
+from memory_allocation_engine import FREE_PROCESS_ID
+
+# Segment table placement, and the spacing between rows and how many fit below the header
+SEGMENT_TABLE_X = 0.1
+SEGMENT_TABLE_Y = 0.9
+SEGMENT_TABLE_WIDTH = 0.8
+SEGMENT_COLUMN_WIDTH = SEGMENT_TABLE_WIDTH / 4
+SEGMENT_ROW_SPACING = 0.12
+SEGMENT_ROWS = int(0.8 / SEGMENT_ROW_SPACING)
+
+# Horizontal room, in points, past the memory axes for the start and end addresses
+# centred on its edges, so blitting clears and repaints them too
+MEMORY_ADDRESS_PAD = 36
+
+class ArtistPool:
+    """Keeps artists alive between frames so updates mutate them instead of recreating them"""
+    def __init__(self, factory):
+        self.factory = factory
+        self.artists = []
+        self.used = 0
+
+    def reset(self):
+        self.used = 0
+
+    def next(self):
+        """Return the next free artist, creating one only when the pool runs out"""
+        if self.used == len(self.artists):
+            self.artists.append(self.factory())
+        artist = self.artists[self.used]
+        self.used += 1
+        artist.set_visible(True)
+        return artist
+
+    def hide_unused(self):
+        for artist in self.artists[self.used:]:
+            artist.set_visible(False)
+
+    def resize(self, count):
+        """Use exactly the first count artists, showing new ones and hiding the surplus"""
+        while len(self.artists) < count:
+            self.artists.append(self.factory())
+        for artist in self.artists[self.used:count]:
+            artist.set_visible(True)
+        for artist in self.artists[count:self.used]:
+            artist.set_visible(False)
+        self.used = count
+        return self.artists[:count]
 
 # Visualization class (Modified to integrate with tkinter)
 class MemoryVisualizer:
     def __init__(self):
         # Create matplotlib figure with two subplots with increased height
         self.fig, self.axes = plt.subplots(2, 1, figsize=(14, 9))  # Increased height
-        self.fig.tight_layout(pad=4.0)  # Increased padding
-        self.process_colors = {}
-        self.color_cycle = iter(mcolors.TABLEAU_COLORS)
-        
-        # Cache for optimization
-        self.memory_patches = []
-        self.page_table_patches = []
+        self.palette = tuple(mcolors.TABLEAU_COLORS)
+        self.palette_rgba = mcolors.to_rgba_array(self.palette)
+        self.free_rgba = mcolors.to_rgba('lightgrey')
         
         # Memory axes - adjusted margins for better text display
         self.memory_ax = self.axes[0]
@@ -25,7 +70,7 @@ class MemoryVisualizer:
         self.memory_ax.set_yticks([])
         
         # Add padding to axes
-        self.memory_ax.set_position([0.125, 0.55, 0.775, 0.4])  # [left, bottom, width, height]
+        self.memory_ax.set_position([0.1, 0.58, 0.85, 0.38])  # [left, bottom, width, height]
         
         # Page/Segment table axes
         self.table_ax = self.axes[1]
@@ -35,118 +80,251 @@ class MemoryVisualizer:
         self.table_ax.set_xticks([])
         self.table_ax.set_yticks([])
         
-        # Add padding to axes
-        self.table_ax.set_position([0.125, 0.1, 0.775, 0.4])  # [left, bottom, width, height]
-        # Create matplotlib figure with two subplots
-        self.fig, self.axes = plt.subplots(2, 1, figsize=(12, 8))
-        self.fig.tight_layout(pad=4.0)  # Increased padding between subplots
-        self.process_colors = {}
-        self.color_cycle = iter(mcolors.TABLEAU_COLORS)
-            
-            # Cache for optimization
-        self.memory_patches = []
-        self.page_table_patches = []
-            
-            # Memory axes
-        self.memory_ax = self.axes[0]
-        self.memory_ax.set_title('Memory Allocation', fontsize=14)  # Increased title font size
-        self.memory_ax.set_xlim(0, 1)
-        self.memory_ax.set_ylim(0, 1)
-        self.memory_ax.set_xticks([])
-        self.memory_ax.set_yticks([])
-            
-            # Page/Segment table axes
-        self.table_ax = self.axes[1]
-        self.table_ax.set_title('Page/Segment Table', fontsize=14)  # Increased title font size
-        self.table_ax.set_xlim(0, 1)
-        self.table_ax.set_ylim(0, 1)
-        self.table_ax.set_xticks([])
-        self.table_ax.set_yticks([])
+        # Add padding to axes, giving more space to the table
+        self.table_ax.set_position([0.1, 0.08, 0.85, 0.43])  # [left, bottom, width, height]
+
+        # Blitting: the memory artists are animated, so a full draw only renders the
+        # static axes. Their backgrounds are cached after each full draw and updates
+        # repaint just the artists on top of them.
+        self._memory_bg = None
+        self._table_bg = None
+        self._bg_bounds = None
+        self._table_title = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.canvas.mpl_connect('resize_event', self._on_resize)
+
+        # What was drawn last time, so updates only touch the blocks and frames that changed
+        self._memory_snapshot = None
+        self._memory_total = None
+        self._table_keys = None
+        self._table_layout = None
+
+        # The memory strip and the paging grid are one collection each, not a patch per block
+        self.memory_blocks = self._add_collection(self.memory_ax)
+        self.frame_cells = self._add_collection(self.table_ax)
+
+        # Artist pools, reused across updates and hidden when not needed
+        memory_ax, table_ax = self.memory_ax, self.table_ax
+        self.memory_pools = {
+            'labels': ArtistPool(lambda: memory_ax.text(0, 0, '', ha='center', va='center', fontsize=12,
+                                                        animated=True)),
+            'addresses': ArtistPool(lambda: memory_ax.text(0, 0, '', ha='center', fontsize=10, animated=True)),
+        }
+        self.frame_labels = ArtistPool(lambda: table_ax.text(0, 0, '', ha='center', va='center', fontsize=10,
+                                                             animated=True))
+        self.segment_pools = {
+            'indicators': ArtistPool(lambda: self._add_rect(table_ax, edgecolor='black')),
+            'cells': ArtistPool(lambda: table_ax.text(0, 0, '', ha='center', fontsize=10, animated=True)),
+            'more': ArtistPool(lambda: table_ax.text(0, 0, '', ha='center', fontsize=9, style='italic',
+                                                     animated=True)),
+        }
+
+        # The segment table header row and separator line never change, so they are
+        # built once and only shown in segmentation mode
+        self.segment_header = [
+            table_ax.text(SEGMENT_TABLE_X + SEGMENT_COLUMN_WIDTH*col, SEGMENT_TABLE_Y, header,
+                          ha='center', fontsize=11, weight='bold', animated=True, visible=False)
+            for col, header in enumerate(("Process", "Base", "Limit", "End"))
+        ]
+        self.segment_header.append(table_ax.add_patch(patches.Rectangle(
+            (SEGMENT_TABLE_X - 0.05, SEGMENT_TABLE_Y - 0.05), SEGMENT_TABLE_WIDTH + 0.1, 0.01,
+            facecolor='black', animated=True, visible=False)))
         
     def get_figure(self):
         """Return the matplotlib figure for embedding in tkinter"""
         return self.fig
     
+    def _on_draw(self, event):
+        """Cache the axes backgrounds after a full draw and paint the animated artists"""
+        canvas = self.fig.canvas
+        self._memory_bg = canvas.copy_from_bbox(self._memory_bbox())
+        self._table_bg = canvas.copy_from_bbox(self.table_ax.bbox)
+        self._bg_bounds = (self.memory_ax.bbox.bounds, self.table_ax.bbox.bounds)
+        self._draw_memory_artists()
+        self._draw_table_artists()
+
+    def _on_resize(self, event):
+        """Drop the cached backgrounds; the next full draw captures new ones"""
+        self._memory_bg = None
+        self._table_bg = None
+
+    def _memory_bbox(self):
+        """The memory axes area, widened so the addresses centred on its edges are included"""
+        x0, y0, x1, y1 = self.memory_ax.bbox.extents
+        pad = MEMORY_ADDRESS_PAD * self.fig.dpi / 72
+        return Bbox.from_extents(x0 - pad, y0, x1 + pad, y1)
+
+    def _draw_memory_artists(self):
+        self.memory_ax.draw_artist(self.memory_blocks)
+        for pool in self.memory_pools.values():
+            for artist in pool.artists[:pool.used]:
+                self.memory_ax.draw_artist(artist)
+
+    def _draw_table_artists(self):
+        self.table_ax.draw_artist(self.frame_cells)
+        for artist in self.segment_header:
+            self.table_ax.draw_artist(artist)
+        for pool in (self.frame_labels, *self.segment_pools.values()):
+            for artist in pool.artists[:pool.used]:
+                self.table_ax.draw_artist(artist)
+
+    @staticmethod
+    def _add_rect(ax, **style):
+        return ax.add_patch(patches.Rectangle((0, 0), 0, 0, animated=True, **style))
+
+    @staticmethod
+    def _add_collection(ax):
+        collection = PolyCollection([], edgecolors='black', linewidths=1, animated=True)
+        ax.add_collection(collection, autolim=False)
+        return collection
+
+    @staticmethod
+    def _rect_verts(x, y, width, height):
+        """Corner array of shape (n, 4, 2) for rectangles given as arrays or broadcast scalars"""
+        x, y, width, height = np.broadcast_arrays(x, y, width, height)
+        return np.stack([np.stack(corner, axis=-1) for corner in
+                         ((x, y), (x + width, y), (x + width, y + height), (x, y + height))], axis=1)
+
+    @staticmethod
+    def _place_rect(pool, x, y, width, height, color):
+        rect = pool.next()
+        rect.set_bounds(x, y, width, height)
+        rect.set_facecolor(color)
+        return rect
+
+    @staticmethod
+    def _place_text(pool, x, y, text):
+        text_obj = pool.next()
+        text_obj.set_position((x, y))
+        text_obj.set_text(text)
+        return text_obj
+
+    def _blit(self, memory=True, table=True):
+        """Repaint the animated artists of the changed axes over their cached backgrounds"""
+        if not (memory or table):
+            return
+        bounds = (self.memory_ax.bbox.bounds, self.table_ax.bbox.bounds)
+        if self._memory_bg is None or self._table_bg is None or bounds != self._bg_bounds:
+            # Nothing valid to restore (first frame, resize or layout change): full redraw
+            self.fig.canvas.draw_idle()
+            return
+        canvas = self.fig.canvas
+        if memory:
+            canvas.restore_region(self._memory_bg)
+            self._draw_memory_artists()
+            canvas.blit(self._memory_bbox())
+        if table:
+            canvas.restore_region(self._table_bg)
+            self._draw_table_artists()
+            canvas.blit(self.table_ax.bbox)
+
     def _get_process_color(self, process_id):
         if process_id is None:
             return 'lightgrey'
-        if process_id not in self.process_colors:
-            try:
-                self.process_colors[process_id] = next(self.color_cycle)
-            except StopIteration:
-                self.color_cycle = iter(mcolors.TABLEAU_COLORS)
-                self.process_colors[process_id] = next(self.color_cycle)
-        return self.process_colors[process_id]
-
-    def update_memory_view(self, memory_snapshot, total_memory_size):
-        for patch in self.memory_patches:
-            patch.remove()
-        self.memory_patches = []
+        # Process ids start at 1, so P1 gets the first palette color
+        return self.palette[(process_id - 1) % len(self.palette)]
+
+    def _get_process_colors(self, process_ids):
+        """RGBA colors for an array of process ids, with free blocks in light grey"""
+        colors = self.palette_rgba[(process_ids - 1) % len(self.palette_rgba)]
+        colors[process_ids == FREE_PROCESS_ID] = self.free_rgba
+        return colors
+
+    def update_memory_view(self, snapshot, total_memory_size):
+        """Update the memory strip from a memory block array; returns False if nothing changed"""
+        count = len(snapshot)
+        previous = self._memory_snapshot if total_memory_size == self._memory_total else None
+        
+        # Blocks whose place or owner differs from the last update
+        changed = np.ones(count, dtype=bool)
+        if previous is not None:
+            overlap = min(count, len(previous))
+            changed[:overlap] = snapshot[:overlap] != previous[:overlap]
+            if count == len(previous) and not changed.any():
+                return False
+        self._memory_snapshot = snapshot
+        self._memory_total = total_memory_size
         
         # Adjust height and position to provide more space for text
         height = 0.6  # Reduced height to leave more room for labels
         y_pos = 0.25  # Moved up slightly to center in available space
         
-        for block in memory_snapshot:
-            start_pct = block['start'] / total_memory_size
-            width_pct = block['size'] / total_memory_size
-            
-            color = self._get_process_color(block['process_id'])
-            rect = patches.Rectangle((start_pct, y_pos), width_pct, height, 
-                                    facecolor=color, edgecolor='black', linewidth=1)
-            self.memory_ax.add_patch(rect)
-            self.memory_patches.append(rect)
-            
-            # Only add process text if block is wide enough
-            if block['size'] / total_memory_size > 0.05:
-                text_x = start_pct + width_pct / 2
-                text_y = y_pos + height / 2
-                text = f"P{block['process_id']}" if block['process_id'] is not None else "Free"
-                text_obj = self.memory_ax.text(text_x, text_y, text, ha='center', va='center', fontsize=12)
-                self.memory_patches.append(text_obj)
-            
-            # Staggered position for address labels to prevent overlap
-            index = memory_snapshot.index(block)
-            if index % 2 == 0:
-                # Top position for even-indexed blocks
-                start_text = self.memory_ax.text(start_pct, y_pos + height + 0.05, f"{block['start']}", 
-                                            ha='center', va='bottom', fontsize=10)
-            else:
-                # Bottom position for odd-indexed blocks
-                start_text = self.memory_ax.text(start_pct, y_pos - 0.05, f"{block['start']}", 
-                                            ha='center', va='top', fontsize=10)
-            self.memory_patches.append(start_text)
-            
-            # Only add end address for the last block
-            if block == memory_snapshot[-1]:
-                end_text = self.memory_ax.text(start_pct + width_pct, y_pos - 0.05, f"{block['end']}", 
-                                        ha='center', va='top', fontsize=10)
-                self.memory_patches.append(end_text)
+        # Block geometry for the whole snapshot at once
+        start_pcts = snapshot['start'] / total_memory_size
+        width_pcts = snapshot['size'] / total_memory_size
         
-        self.memory_ax.set_title('Memory Allocation', fontsize=14)
-
-    def update_page_table_view(self, page_table_snapshot, page_size, total_memory_size, method):
-        # Clear the axis first
-        self.table_ax.clear()
+        self.memory_blocks.set_verts(self._rect_verts(start_pcts, y_pos, width_pcts, height))
+        self.memory_blocks.set_facecolor(self._get_process_colors(snapshot['process_id']))
         
-        # Carefully handle patch removal with error protection
-        for patch in self.page_table_patches:
-            try:
-                if patch in self.table_ax.patches or hasattr(patch, 'remove'):
-                    patch.remove()
-            except (NotImplementedError, ValueError):
-                # Skip items that can't be removed
-                pass
+        # One label and one start address per block, plus the end address of the last block
+        labels = self.memory_pools['labels'].resize(count)
+        addresses = self.memory_pools['addresses'].resize(count + 1)
         
-        # Reset the patches list
-        self.page_table_patches = []
+        # Label and address placement, only for blocks whose place or owner changed.
+        # Start addresses are staggered (even-indexed blocks above the strip,
+        # odd-indexed below) to prevent overlap
+        changed_index = np.flatnonzero(changed)
+        even = changed_index % 2 == 0
+        address_ys = np.where(even, y_pos + height + 0.05, y_pos - 0.05)
+        address_vas = np.where(even, 'bottom', 'top')
+        label_xs = start_pcts[changed_index] + width_pcts[changed_index] / 2
+        # Only show process text if block is wide enough
+        show_labels = width_pcts[changed_index] > 0.05
         
-        # Set up common axis properties
-        self.table_ax.set_xlim(0, 1)
-        self.table_ax.set_ylim(0, 1)
-        self.table_ax.set_xticks([])
-        self.table_ax.set_yticks([])
+        for index, label_x, show_label, address_x, address_y, address_va, process_id, start in zip(
+                changed_index.tolist(), label_xs.tolist(), show_labels.tolist(), start_pcts[changed_index].tolist(),
+                address_ys.tolist(), address_vas.tolist(), snapshot['process_id'][changed_index].tolist(),
+                snapshot['start'][changed_index].tolist()):
+            label = labels[index]
+            label.set_visible(show_label)
+            label.set_position((label_x, y_pos + height / 2))
+            label.set_text(f"P{process_id}" if process_id != FREE_PROCESS_ID else "Free")
+            
+            start_text = addresses[index]
+            start_text.set_position((address_x, address_y))
+            start_text.set_verticalalignment(address_va)
+            start_text.set_text(f"{start}")
+        
+        # End address for the last block
+        end_text = addresses[count]
+        end_text.set_position((start_pcts[-1] + width_pcts[-1], y_pos - 0.05))
+        end_text.set_text(f"{snapshot['end'][-1]}")
+        end_text.set_verticalalignment('top')
+        return True
+
+    def update_page_table_view(self, page_table_snapshot, page_size, total_memory_size, method):
+        # A new title is part of the static background, so it needs a full redraw
+        title = 'Page Table' if method == "paging" else 'Segment Table'
+        if title != self._table_title:
+            self._table_title = title
+            self.table_ax.set_title(title, fontsize=14)
+            self._table_bg = None
+
+        if method == "paging":
+            keys = [frame['process_id'] for frame in page_table_snapshot]
+            layout = (method, len(keys))
+        else:
+            # The table gets the memory snapshot; only the allocated blocks that fit are shown
+            allocated = np.flatnonzero(page_table_snapshot['process_id'] != FREE_PROCESS_ID)
+            shown = allocated[:SEGMENT_ROWS]
+            hidden_segments = len(allocated) - len(shown)
+            segments = page_table_snapshot[shown].tolist()
+            keys = (segments, hidden_segments)
+            layout = (method,)
+        if layout == self._table_layout and keys == self._table_keys:
+            return False
+        previous = self._table_keys if layout == self._table_layout else None
+        self._table_keys = keys
+        self._table_layout = layout
+
+        # Pooled artists are reused, so the axis is not cleared between updates
+        pools = self.segment_pools
+        for pool in pools.values():
+            pool.reset()
+        for artist in self.segment_header:
+            artist.set_visible(method != "paging")
         
+        # Limits, ticks and the title are set once and stay put since the axis is never cleared
         if method == "paging":
             num_frames = len(page_table_snapshot)
             # Calculate optimal grid size based on number of frames
@@ -160,88 +338,55 @@ class MemoryVisualizer:
             start_x = 0.05
             start_y = 0.95
             
-            for i, frame in enumerate(page_table_snapshot):
-                row = i // grid_size
-                col = i % grid_size
-                
-                x = start_x + col * (cell_width * 1.1)  # Add 10% spacing between cells
-                y = start_y - (row + 1) * (cell_height * 1.1)  # Add 10% spacing between rows
-                
-                color = self._get_process_color(frame['process_id'])
-                rect = patches.Rectangle((x, y), cell_width, cell_height,
-                                        facecolor=color, edgecolor='black', linewidth=1)
-                self.table_ax.add_patch(rect)
-                self.page_table_patches.append(rect)
-                
+            rows, cols = np.divmod(np.arange(num_frames), grid_size)
+            xs = start_x + cols * (cell_width * 1.1)  # Add 10% spacing between cells
+            ys = start_y - (rows + 1) * (cell_height * 1.1)  # Add 10% spacing between rows
+            
+            self.frame_cells.set_verts(self._rect_verts(xs, ys, cell_width, cell_height))
+            self.frame_cells.set_facecolor([self._get_process_color(frame['process_id'])
+                                            for frame in page_table_snapshot])
+            self.frame_cells.set_visible(True)
+            
+            frame_labels = self.frame_labels.resize(num_frames)
+            for index, (frame, x, y) in enumerate(zip(page_table_snapshot, xs, ys)):
+                # Frames that kept their owner keep their labels as they are
+                if previous is not None and previous[index] == keys[index]:
+                    continue
                 text = f"F{frame['frame_id']}"
                 if frame['process_id'] is not None:
                     text += f"\nP{frame['process_id']}"
-                text_obj = self.table_ax.text(x + cell_width/2, y + cell_height/2, 
-                                            text, ha='center', va='center', fontsize=10)
-                self.page_table_patches.append(text_obj)
-            
-            self.table_ax.set_title('Page Table', fontsize=14)
+                frame_labels[index].set_position((x + cell_width/2, y + cell_height/2))
+                frame_labels[index].set_text(text)
             
         else:  # segmentation
-            self.table_ax.set_title('Segment Table', fontsize=14)
-
-            segments = [block for block in page_table_snapshot if block['process_id'] is not None]
-
-            table_start_x = 0.1
-            table_start_y = 0.9
-            table_width = 0.8
-            col_width = table_width / 4
-
-            # Header row
-            header_y = table_start_y
-            header_process = self.table_ax.text(table_start_x + col_width*0, header_y, "Process", 
-                                ha='center', fontsize=11, weight='bold')
-            header_base = self.table_ax.text(table_start_x + col_width*1, header_y, "Base", 
-                                ha='center', fontsize=11, weight='bold')
-            header_limit = self.table_ax.text(table_start_x + col_width*2, header_y, "Limit", 
-                                ha='center', fontsize=11, weight='bold')
-            header_end = self.table_ax.text(table_start_x + col_width*3, header_y, "End", 
-                                ha='center', fontsize=11, weight='bold')
-            self.page_table_patches.extend([header_process, header_base, header_limit, header_end])
-
-            # Separator line
-            line = patches.Rectangle((table_start_x - 0.05, header_y - 0.05), 
-                                    table_width + 0.1, 0.01, facecolor='black')
-            self.table_ax.add_patch(line)
-            self.page_table_patches.append(line)
+            self.frame_cells.set_visible(False)
+            self.frame_labels.resize(0)
+
+            table_start_x = SEGMENT_TABLE_X
+            col_width = SEGMENT_COLUMN_WIDTH
+            header_y = SEGMENT_TABLE_Y
 
             # Spacing setup
             initial_row_gap = 0.13   # Increased spacing between header and first row
-            row_spacing = 0.12
-            max_rows = min(len(segments), int(0.8 / row_spacing))
+            row_spacing = SEGMENT_ROW_SPACING
 
-            for i, segment in enumerate(segments[:max_rows]):
+            for i, (start, size, end, process_id) in enumerate(segments):
                 row_y = header_y - initial_row_gap - (i * row_spacing)
 
-                color = self._get_process_color(segment['process_id'])
-                proc_indicator = patches.Rectangle((table_start_x - 0.03, row_y - 0.02), 0.02, 0.02,
-                                                facecolor=color, edgecolor='black')
-                self.table_ax.add_patch(proc_indicator)
-                self.page_table_patches.append(proc_indicator)
+                color = self._get_process_color(process_id)
+                self._place_rect(pools['indicators'], table_start_x - 0.03, row_y - 0.02, 0.02, 0.02, color)
 
-                pid_text = self.table_ax.text(table_start_x + col_width*0, row_y, f"P{segment['process_id']}", 
-                                            ha='center', fontsize=10)
-                base_text = self.table_ax.text(table_start_x + col_width*1, row_y, f"{segment['start']}", 
-                                            ha='center', fontsize=10)
-                limit_text = self.table_ax.text(table_start_x + col_width*2, row_y, f"{segment['size']}", 
-                                                ha='center', fontsize=10)
-                end_text = self.table_ax.text(table_start_x + col_width*3, row_y, f"{segment['end']}", 
-                                            ha='center', fontsize=10)
+                cells = (f"P{process_id}", f"{start}", f"{size}", f"{end}")
+                for col, cell in enumerate(cells):
+                    self._place_text(pools['cells'], table_start_x + col_width*col, row_y, cell)
 
-                self.page_table_patches.extend([pid_text, base_text, limit_text, end_text])
+            if hidden_segments:
+                self._place_text(pools['more'], 0.5, header_y - initial_row_gap - (len(segments) * row_spacing),
+                                 f"+ {hidden_segments} more segments")
 
-            if len(segments) > max_rows:
-                more_text = self.table_ax.text(0.5, header_y - initial_row_gap - (max_rows * row_spacing), 
-                                            f"+ {len(segments) - max_rows} more segments", 
-                                            ha='center', fontsize=9, style='italic')
-                self.page_table_patches.append(more_text)
-
-            self.table_ax.figure.canvas.draw_idle()
+        for pool in pools.values():
+            pool.hide_unused()
+        return True
 
     def update_visualization(self, memory_snapshot, page_table_snapshot, stats, events,
                              total_memory_size, page_size, method):
@@ -249,7 +394,7 @@ class MemoryVisualizer:
         Update the visualization for both memory allocation and page/segment table.
         
         Parameters:
-        - memory_snapshot: List of memory blocks with their allocation status
+        - memory_snapshot: Memory blocks as returned by MemoryManager.get_memory_array()
         - page_table_snapshot: List of page table entries (for paging) or segment table entries (for segmentation)
         - stats: Dictionary of memory statistics
         - events: List of recent memory events
@@ -257,23 +402,21 @@ class MemoryVisualizer:
         - page_size: Size of each page (for paging)
         - method: Allocation method ("paging" or "segmentation")
         """
-        self.update_memory_view(memory_snapshot, total_memory_size)
+        memory_changed = self.update_memory_view(memory_snapshot, total_memory_size)
     
         # Update page or segment table view based on method
         if method == "segmentation":
-            # For segmentation, use memory_snapshot for the segment table
-            self.update_page_table_view(memory_snapshot, page_size, total_memory_size, method)
+            # For segmentation, use memory_snapshot for the segment table. It is built
+            # from the same blocks, so it can only change when the memory view did
+            if memory_changed or self._table_layout != (method,):
+                table_changed = self.update_page_table_view(memory_snapshot, page_size, total_memory_size, method)
+            else:
+                table_changed = False
         else:
             # For paging, use page_table_snapshot
-            self.update_page_table_view(page_table_snapshot, page_size, total_memory_size, method)
+            table_changed = self.update_page_table_view(page_table_snapshot, page_size, total_memory_size, method)
 
-        # Make sure the layout is properly adjusted
-        self.fig.tight_layout(pad=4.0)
-        
-        # Ensure axes don't overlap
-        # Change in update_visualization method
-        self.memory_ax.set_position([0.1, 0.58, 0.85, 0.38])  # Wider, slightly higher
-        self.table_ax.set_position([0.1, 0.08, 0.85, 0.43])  # Give more space to the table
+        self._blit(memory_changed, table_changed)
 
 from tkinter import ttk, font
 
@@ -293,6 +436,11 @@ class ModernUI:
     
     @classmethod
     def apply_theme(cls, root):
+        # Fonts and styles belong to a Tk root, so they are built once and kept on the root
+        fonts = getattr(root, 'modern_ui_fonts', None)
+        if fonts is not None:
+            return fonts
+        
         style = ttk.Style()
         style.theme_use('clam')
         
@@ -325,9 +473,10 @@ class ModernUI:
         root.configure(background=cls.BACKGROUND)
         
         # Increased font sizes
-        return {
+        root.modern_ui_fonts = {
             'title': font.Font(family='Helvetica', size=14, weight='bold'),  # Increased size
             'heading': font.Font(family='Helvetica', size=12, weight='bold'),  # Increased size
             'normal': font.Font(family='Helvetica', size=11),  # Increased size
             'small': font.Font(family='Helvetica', size=10)  # Increased size
-        }
\ No newline at end of file
+        }
+        return root.modern_ui_fonts
\ No newline at end of file